@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from enum import Enum
 import random
 from uuid import uuid4
@@ -164,9 +164,46 @@ class GameBoard:
             display_grid.append(display_row)
         return display_grid
 
+class AttackView:
+    """What an attacker legitimately knows about a board: where it has shot,
+    which shots hit, and which ship types have been sunk. Ship positions
+    are never exposed."""
+    def __init__(self, board: GameBoard):
+        self.size = board.size
+        self.shots_taken = frozenset(board.shots_taken)
+        self.hits = frozenset(
+            (r, c) for r, c in board.shots_taken if board.grid[r][c] == CellState.HIT
+        )
+        self.misses = self.shots_taken - self.hits
+        self.sunk_ships = [ship.ship_type for ship in board.ships if ship.is_sunk]
+
+def random_shot(view: AttackView) -> Optional[Tuple[int, int]]:
+    """Pick a random position that has not been shot at yet"""
+    available_positions = [
+        (r, c) for r in range(view.size)
+        for c in range(view.size)
+        if (r, c) not in view.shots_taken
+    ]
+    
+    if not available_positions:
+        return None
+    
+    return random.choice(available_positions)
+
+# Computer targeting strategies, keyed by name. Each takes an AttackView of
+# the board being attacked, so it only sees shot results and never where the
+# ships are, and returns the next position to shoot, or None if none remain.
+COMPUTER_STRATEGIES: Dict[str, Callable[[AttackView], Optional[Tuple[int, int]]]] = {
+    "random": random_shot,
+}
+
 class BattleshipGame:
-    def __init__(self):
+    def __init__(self, strategy: str = "random"):
+        if strategy not in COMPUTER_STRATEGIES:
+            raise ValueError(f"Unknown computer strategy: {strategy}")
+        
         self.game_id = str(uuid4())
+        self.strategy = strategy
         self.player_board = GameBoard()
         self.computer_board = GameBoard()
         self.current_turn = "player"  # "player" or "computer"
@@ -199,17 +236,19 @@ class BattleshipGame:
         if self.game_over or self.current_turn != "computer":
             return {"valid": False, "message": "Not computer's turn or game is over"}
         
-        # Simple AI: random shots avoiding already shot positions
-        available_positions = [
-            (r, c) for r in range(self.player_board.size) 
-            for c in range(self.player_board.size)
-            if (r, c) not in self.player_board.shots_taken
-        ]
+        view = AttackView(self.player_board)
+        position = COMPUTER_STRATEGIES[self.strategy](view)
+        
+        # A faulty strategy must not leave the game stuck on the computer's turn
+        if position is not None:
+            row, col = position
+            if not self.player_board.is_valid_position(row, col) or (row, col) in view.shots_taken:
+                position = random_shot(view)
         
-        if not available_positions:
+        if position is None:
             return {"valid": False, "message": "No positions available"}
         
-        row, col = random.choice(available_positions)
+        row, col = position
         result = self.player_board.shoot(row, col)
         result["position"] = (row, col)
         
@@ -1,22 +1,32 @@
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from typing import Dict
 import os
 
 from game_logic import BattleshipGame
+from static_assets import Asset, StaticAssets, REVALIDATE_CACHE_CONTROL
 
 app = FastAPI(title="Battleship Game", description="A FastAPI implementation of the classic Battleship game")
 
+# Resolve static and templates relative to this file so the app works from any directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+
 # Create static and templates directories if they don't exist
-os.makedirs("static", exist_ok=True)
-os.makedirs("templates", exist_ok=True)
+os.makedirs(STATIC_DIR, exist_ok=True)
+os.makedirs(TEMPLATES_DIR, exist_ok=True)
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Load static files and render the page once at startup; both are served from memory
+static_assets = StaticAssets(STATIC_DIR)
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+index_page = Asset(
+    "index.html",
+    templates.get_template("index.html").render(static_url=static_assets.url).encode("utf-8"),
+    media_type="text/html; charset=utf-8"
+)
 
 # In-memory game storage (in production, use a database)
 games: Dict[str, BattleshipGame] = {}
@@ -25,10 +35,39 @@ class ShotRequest(BaseModel):
     row: int
     col: int
 
-@app.get("/", response_class=HTMLResponse)
+def asset_response(request: Request, asset: Asset, cache_control: str) -> Response:
+    """Serve the best pre-compressed variant of an asset, or a 304 if the client has it"""
+    encoding, body = asset.negotiate(request.headers.get("accept-encoding", ""))
+    etag = asset.etag(encoding)
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    
+    # If-None-Match uses weak comparison, so W/"..." validators from proxies still match
+    if_none_match = request.headers.get("if-none-match", "")
+    client_tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if if_none_match.strip() == "*" or etag in client_tags:
+        return Response(status_code=304, headers=headers)
+    
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        return Response(media_type=asset.media_type, headers=headers)
+    return Response(content=body, media_type=asset.media_type, headers=headers)
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def home(request: Request):
     """Serve the main game page"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return asset_response(request, index_page, REVALIDATE_CACHE_CONTROL)
+
+@app.api_route("/static/{filename}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_file(request: Request, filename: str):
+    """Serve a static asset; fingerprinted names are cached forever"""
+    found = static_assets.lookup(filename)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    
+    asset, cache_control = found
+    return asset_response(request, asset, cache_control)
 
 @app.post("/api/new-game")
 async def new_game():
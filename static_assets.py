@@ -0,0 +1,111 @@
+"""
+In-memory static asset cache with fingerprinted names and pre-compressed variants.
+
+Everything is built once at startup so serving an asset is a dictionary lookup.
+"""
+
+import gzip
+import mimetypes
+import os
+from hashlib import sha256
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Fingerprinted URLs change whenever the content does, so they can be cached forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Unversioned URLs and the page itself must be revalidated, which is a cheap 304
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value.
+
+    A missing q means 1.0; a malformed one is treated as a refusal.
+    """
+    qualities: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    return qualities
+
+
+class Asset:
+    def __init__(self, name: str, body: bytes, media_type: Optional[str] = None):
+        self.name = name
+        self.media_type = media_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.digest = sha256(body).hexdigest()[:12]
+
+        stem, suffix = os.path.splitext(name)
+        self.fingerprinted_name = f"{stem}.{self.digest}{suffix}"
+
+        # Only keep compressed variants that are actually smaller
+        self.variants: Dict[str, bytes] = {"identity": body}
+        if brotli is not None:
+            compressed = brotli.compress(body, quality=11)
+            if len(compressed) < len(body):
+                self.variants["br"] = compressed
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            self.variants["gzip"] = compressed
+
+    def negotiate(self, accept_encoding: str) -> Tuple[str, bytes]:
+        """Pick the best variant for an Accept-Encoding header, preferring brotli on ties"""
+        qualities = parse_accept_encoding(accept_encoding)
+        best_encoding, best_q = "identity", 0.0
+        for encoding in ("br", "gzip"):
+            if encoding not in self.variants:
+                continue
+            # An explicitly listed coding wins over the wildcard, including q=0 refusals
+            q = qualities.get(encoding, qualities.get("*", 0.0))
+            if q > best_q:
+                best_encoding, best_q = encoding, q
+        return best_encoding, self.variants[best_encoding]
+
+    def etag(self, encoding: str) -> str:
+        if encoding == "identity":
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+
+class StaticAssets:
+    def __init__(self, directory: str, url_prefix: str = "/static"):
+        self.url_prefix = url_prefix
+        self.assets: Dict[str, Asset] = {}
+        self._by_fingerprint: Dict[str, Asset] = {}
+
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(path):
+                continue
+            with open(path, "rb") as f:
+                asset = Asset(name, f.read())
+            self.assets[name] = asset
+            self._by_fingerprint[asset.fingerprinted_name] = asset
+
+    def url(self, name: str) -> str:
+        """Fingerprinted URL for an asset, for use in templates"""
+        return f"{self.url_prefix}/{self.assets[name].fingerprinted_name}"
+
+    def lookup(self, name: str) -> Optional[Tuple[Asset, str]]:
+        """Find an asset by fingerprinted or plain name, with the Cache-Control to serve it with"""
+        if name in self._by_fingerprint:
+            return self._by_fingerprint[name], IMMUTABLE_CACHE_CONTROL
+        if name in self.assets:
+            return self.assets[name], REVALIDATE_CACHE_CONTROL
+        return None
@@ -5,7 +5,7 @@ Unit tests for the computer player functionality in the Battleship game
 
 import unittest
 from unittest.mock import patch
-from game_logic import BattleshipGame, GameBoard, CellState, ShipType
+from game_logic import AttackView, BattleshipGame, COMPUTER_STRATEGIES, GameBoard, CellState, ShipType
 
 
 class TestComputerPlayer(unittest.TestCase):
@@ -171,6 +171,37 @@ class TestComputerPlayer(unittest.TestCase):
         self.assertFalse(result["valid"])
         self.assertEqual(result["message"], "No positions available")
     
+    def test_invalid_strategy_move_falls_back(self):
+        """Test that a strategy repeating a shot or firing off the board cannot stall the game"""
+        self.game.player_board.shots_taken.add((0, 0))
+        
+        for bad_position in [(0, 0), (-1, 3), (10, 10)]:
+            with patch.dict(COMPUTER_STRATEGIES, {"random": lambda view: bad_position}):
+                self.game.current_turn = "computer"
+                result = self.game.computer_shoot()
+            
+            self.assertTrue(result["valid"])
+            self.assertNotEqual(result["position"], bad_position)
+            if not result.get("game_over", False):
+                self.assertEqual(self.game.current_turn, "player")
+    
+    def test_attack_view_hides_ships(self):
+        """Test that the attack view reports shot results but not ship positions"""
+        board = GameBoard()
+        board.place_ship(ShipType.DESTROYER, [(0, 0), (0, 1)])
+        board.shoot(0, 0)
+        board.shoot(5, 5)
+        
+        view = AttackView(board)
+        
+        self.assertEqual(view.hits, {(0, 0)})
+        self.assertEqual(view.misses, {(5, 5)})
+        self.assertEqual(view.sunk_ships, [])
+        self.assertNotIn((0, 1), view.shots_taken)
+        
+        board.shoot(0, 1)
+        self.assertEqual(AttackView(board).sunk_ships, [ShipType.DESTROYER])
+    
     @patch('random.choice')
     def test_computer_random_selection(self, mock_choice):
         """Test that computer uses random selection for shots"""
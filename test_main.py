@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for page and static asset delivery in the FastAPI app
+"""
+
+import unittest
+from fastapi.testclient import TestClient
+from main import app, static_assets
+from static_assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+
+
+class TestAssetDelivery(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a test client and the fingerprinted asset URLs"""
+        self.client = TestClient(app)
+        self.script_url = static_assets.url("script.js")
+        self.style_url = static_assets.url("style.css")
+    
+    def test_home_links_fingerprinted_assets(self):
+        """Test that the rendered page points at fingerprinted script and style URLs"""
+        response = self.client.get("/")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.script_url, response.text)
+        self.assertIn(self.style_url, response.text)
+        self.assertNotIn('"/static/script.js"', response.text)
+        self.assertEqual(response.headers["cache-control"], REVALIDATE_CACHE_CONTROL)
+    
+    def test_home_not_modified(self):
+        """Test that a matching If-None-Match gets an empty 304"""
+        etag = self.client.get("/").headers["etag"]
+        
+        response = self.client.get("/", headers={"If-None-Match": etag})
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+    
+    def test_weak_etag_not_modified(self):
+        """Test that a weakened ETag from a proxy still gets a 304"""
+        etag = self.client.get(self.script_url, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        
+        response = self.client.get(
+            self.script_url,
+            headers={"Accept-Encoding": "gzip", "If-None-Match": f'"other", W/{etag}'}
+        )
+        
+        self.assertEqual(response.status_code, 304)
+    
+    def test_head_asset(self):
+        """Test that HEAD returns the asset headers without a body"""
+        body = static_assets.assets["style.css"].variants["identity"]
+        
+        response = self.client.head(self.style_url, headers={"Accept-Encoding": "identity"})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["content-length"], str(len(body)))
+        self.assertEqual(response.headers["cache-control"], IMMUTABLE_CACHE_CONTROL)
+    
+    def test_head_home(self):
+        """Test that HEAD is answered for the page too"""
+        response = self.client.head("/")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+    
+    def test_fingerprinted_asset_immutable(self):
+        """Test that fingerprinted URLs are cached forever"""
+        response = self.client.get(self.style_url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], IMMUTABLE_CACHE_CONTROL)
+        self.assertTrue(response.headers["content-type"].startswith("text/css"))
+    
+    def test_plain_asset_revalidated(self):
+        """Test that unversioned URLs still work but must be revalidated"""
+        response = self.client.get("/static/script.js")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], REVALIDATE_CACHE_CONTROL)
+    
+    def test_gzip_variant_served(self):
+        """Test that gzip clients get the pre-compressed variant"""
+        response = self.client.get(self.script_url, headers={"Accept-Encoding": "gzip"})
+        
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.content, static_assets.assets["script.js"].variants["identity"])
+    
+    def test_identity_variant_served(self):
+        """Test that clients without compression get the plain body"""
+        response = self.client.get(self.script_url, headers={"Accept-Encoding": "identity"})
+        
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.content, static_assets.assets["script.js"].variants["identity"])
+    
+    def test_unknown_asset_not_found(self):
+        """Test that unknown static names return 404"""
+        response = self.client.get("/static/missing.js")
+        
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-memory static asset cache
+"""
+
+import gzip
+import os
+import unittest
+import static_assets
+from static_assets import Asset, StaticAssets, IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class TestAsset(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a compressible asset"""
+        self.body = b"body { color: navy; }\n" * 50
+        self.asset = Asset("style.css", self.body)
+    
+    def test_fingerprint_tracks_content(self):
+        """Test that the fingerprinted name changes only when the content does"""
+        self.assertEqual(self.asset.fingerprinted_name, Asset("style.css", self.body).fingerprinted_name)
+        self.assertNotEqual(self.asset.fingerprinted_name, Asset("style.css", b"p {}").fingerprinted_name)
+        self.assertTrue(self.asset.fingerprinted_name.startswith("style."))
+        self.assertTrue(self.asset.fingerprinted_name.endswith(".css"))
+    
+    def test_media_type_guessed(self):
+        """Test that the media type comes from the file name"""
+        self.assertEqual(self.asset.media_type, "text/css")
+    
+    def test_negotiate_gzip(self):
+        """Test that gzip is served when accepted and decompresses to the original"""
+        encoding, body = self.asset.negotiate("gzip, deflate")
+        
+        self.assertEqual(encoding, "gzip")
+        self.assertEqual(gzip.decompress(body), self.body)
+    
+    def test_negotiate_identity(self):
+        """Test that the uncompressed body is served without a usable encoding"""
+        self.assertEqual(self.asset.negotiate(""), ("identity", self.body))
+        self.assertEqual(self.asset.negotiate("gzip;q=0"), ("identity", self.body))
+        # An explicit refusal wins over the wildcard
+        self.assertEqual(self.asset.negotiate("br;q=0, gzip;q=0, *"), ("identity", self.body))
+        self.assertEqual(self.asset.negotiate("*, gzip;q=0, br;q=0"), ("identity", self.body))
+        # q is found in any parameter position and matched case-insensitively
+        self.assertEqual(self.asset.negotiate("gzip;level=1;q=0"), ("identity", self.body))
+        self.assertEqual(self.asset.negotiate("gzip;Q=0"), ("identity", self.body))
+        self.assertEqual(self.asset.negotiate("gzip; q=bogus"), ("identity", self.body))
+    
+    def test_negotiate_wildcard(self):
+        """Test that the wildcard accepts codings that are not listed explicitly"""
+        self.assertEqual(self.asset.negotiate("br;q=0, *")[0], "gzip")
+        self.assertEqual(self.asset.negotiate("GZIP;level=1;Q=0.5")[0], "gzip")
+    
+    @unittest.skipIf(static_assets.brotli is None, "brotli is not installed")
+    def test_negotiate_brotli(self):
+        """Test that brotli is preferred on ties and refusable despite the wildcard"""
+        self.assertEqual(self.asset.negotiate("gzip, br")[0], "br")
+        self.assertEqual(self.asset.negotiate("gzip, br;q=0.5")[0], "gzip")
+        self.assertEqual(self.asset.negotiate("br;level=1;Q=0, *")[0], "gzip")
+    
+    def test_etag_per_variant(self):
+        """Test that each encoding gets its own ETag"""
+        self.assertNotEqual(self.asset.etag("identity"), self.asset.etag("gzip"))
+    
+    def test_incompressible_asset_has_no_variants(self):
+        """Test that compressed variants are skipped when they are not smaller"""
+        asset = Asset("tiny.js", b"x")
+        self.assertEqual(asset.negotiate("gzip, br"), ("identity", b"x"))
+
+
+class TestStaticAssets(unittest.TestCase):
+    
+    def setUp(self):
+        """Load the real static directory"""
+        self.assets = StaticAssets(STATIC_DIR)
+    
+    def test_url_is_fingerprinted(self):
+        """Test that template URLs point at fingerprinted names"""
+        url = self.assets.url("script.js")
+        
+        self.assertEqual(url, "/static/" + self.assets.assets["script.js"].fingerprinted_name)
+    
+    def test_lookup_cache_control(self):
+        """Test that only fingerprinted names are cached as immutable"""
+        fingerprinted = self.assets.assets["style.css"].fingerprinted_name
+        
+        self.assertEqual(self.assets.lookup(fingerprinted)[1], IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(self.assets.lookup("style.css")[1], REVALIDATE_CACHE_CONTROL)
+        self.assertIsNone(self.assets.lookup("missing.js"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the computer strategy tournament runner
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+from game_logic import AttackView, BattleshipGame, COMPUTER_STRATEGIES, random_shot
+from tournament import build_board, percentile, play_game, run_tournament, strategy_seed
+
+
+class TestTournament(unittest.TestCase):
+    
+    def test_same_seed_same_layout(self):
+        """Test that a seed always produces the same board layout"""
+        first = build_board(42)
+        second = build_board(42)
+        
+        self.assertEqual(
+            [ship.positions for ship in first.ships],
+            [ship.positions for ship in second.ships]
+        )
+    
+    def test_play_game_sinks_all_ships(self):
+        """Test that a tournament game runs until every ship is sunk"""
+        shots, latencies = play_game("random", 7)
+        
+        ship_cells = sum(len(ship.positions) for ship in build_board(7).ships)
+        self.assertGreaterEqual(shots, ship_cells)
+        self.assertLessEqual(shots, 100)
+        self.assertEqual(len(latencies), shots)
+    
+    def test_strategy_draws_independent_of_layout(self):
+        """Test that the strategy does not reuse the random stream that placed the ships"""
+        first_draws = []
+        
+        def recording_strategy(view):
+            if not first_draws:
+                first_draws.append(random.random())
+            return random_shot(view)
+        
+        with patch.dict(COMPUTER_STRATEGIES, {"recording": recording_strategy}):
+            play_game("recording", 3)
+        
+        layout_stream = random.Random(3)
+        strategy_stream = random.Random(strategy_seed(3))
+        self.assertNotEqual(first_draws[0], layout_stream.random())
+        self.assertEqual(first_draws[0], strategy_stream.random())
+    
+    def test_global_random_state_restored(self):
+        """Test that building boards and playing games leave the global RNG untouched"""
+        state = random.getstate()
+        
+        build_board(11)
+        play_game("random", 11)
+        
+        self.assertEqual(random.getstate(), state)
+    
+    def test_strategies_only_see_attack_view(self):
+        """Test that strategies are handed shot results, never the board itself"""
+        seen = []
+        
+        def recording_strategy(view):
+            seen.append(view)
+            return random_shot(view)
+        
+        with patch.dict(COMPUTER_STRATEGIES, {"recording": recording_strategy}):
+            play_game("recording", 5)
+        
+        self.assertTrue(all(isinstance(view, AttackView) for view in seen))
+        self.assertFalse(hasattr(seen[0], "grid"))
+        self.assertFalse(hasattr(seen[0], "ships"))
+    
+    def test_repeated_shot_rejected(self):
+        """Test that a strategy repeating a shot fails instead of looping forever"""
+        def stuck_strategy(view):
+            return (0, 0)
+        
+        with patch.dict(COMPUTER_STRATEGIES, {"stuck": stuck_strategy}):
+            with self.assertRaisesRegex(ValueError, r"'stuck'.*\(0, 0\).*seed 4"):
+                play_game("stuck", 4)
+    
+    def test_off_board_shot_rejected(self):
+        """Test that a strategy shooting off the board fails"""
+        with patch.dict(COMPUTER_STRATEGIES, {"wild": lambda view: (10, 10)}):
+            with self.assertRaises(ValueError):
+                play_game("wild", 4)
+    
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentile calculation"""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3], 90), 3)
+    
+    def test_run_tournament_reports_every_strategy(self):
+        """Test that the tournament summarises each strategy over all seeds"""
+        results = run_tournament(["random"], list(range(6)), workers=2)
+        
+        stats = results["random"]
+        self.assertEqual(stats["games"], 6)
+        self.assertLessEqual(stats["shots"][50], stats["shots"][99])
+        self.assertLessEqual(stats["latency_us"][50], stats["latency_us"][99])
+    
+    def test_empty_seeds_rejected(self):
+        """Test that a tournament needs at least one layout"""
+        with self.assertRaises(ValueError):
+            run_tournament(["random"], [])
+    
+    def test_zero_workers_rejected(self):
+        """Test that a tournament needs at least one worker"""
+        with self.assertRaises(ValueError):
+            run_tournament(["random"], [0], workers=0)
+    
+    def test_unknown_strategy_rejected(self):
+        """Test that unknown strategies are rejected"""
+        self.assertNotIn("psychic", COMPUTER_STRATEGIES)
+        with self.assertRaises(ValueError):
+            run_tournament(["psychic"], [0])
+        with self.assertRaises(ValueError):
+            BattleshipGame(strategy="psychic")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Strategy tournament for the computer player.
+
+Plays every registered computer strategy against the same set of seeded
+board layouts, spread across CPU cores, and reports how many shots each
+strategy needs to win alongside how long it takes to pick a move.
+
+Usage:
+    python tournament.py --games 500 --workers 4 --strategies random
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from statistics import mean
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from game_logic import COMPUTER_STRATEGIES, AttackView, GameBoard
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextmanager
+def seeded_random(seed):
+    """Seed the global random module for the duration of the block, then restore it"""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def strategy_seed(seed: int) -> str:
+    """Seed for a strategy's own draws, independent of the layout drawn from `seed`"""
+    return f"strategy-{seed}"
+
+
+def build_board(seed: int) -> GameBoard:
+    """Build the board layout for a seed; the same seed always gives the same layout"""
+    with seeded_random(seed):
+        board = GameBoard()
+        board.auto_place_ships()
+    return board
+
+
+def play_game(strategy: str, seed: int) -> Tuple[int, List[float]]:
+    """Play one strategy against one seeded layout until every ship is sunk.
+
+    The strategy only ever sees an AttackView of the board, and a
+    ValueError is raised if it shoots off the board or at a cell it has
+    already shot. Returns the
+    number of shots taken and the time in seconds spent choosing each
+    move, including building that view.
+    """
+    board = build_board(seed)
+    choose_shot = COMPUTER_STRATEGIES[strategy]
+
+    latencies = []
+    # A separate stream keeps the strategy's draws uncorrelated with the ship placement
+    with seeded_random(strategy_seed(seed)):
+        # Every valid move shoots a new cell, so a game can never need more than size ** 2
+        for _ in range(board.size ** 2):
+            if board.all_ships_sunk():
+                break
+
+            start = time.perf_counter()
+            position = choose_shot(AttackView(board))
+            latencies.append(time.perf_counter() - start)
+
+            if position is None:
+                break
+            result = board.shoot(*position)
+            if not result["valid"]:
+                raise ValueError(
+                    f"Strategy {strategy!r} made an invalid move {position} on seed {seed}: "
+                    f"{result['message']}"
+                )
+
+    return len(board.shots_taken), latencies
+
+
+def _play_batch(strategy: str, seeds: Sequence[int]) -> List[Tuple[int, List[float]]]:
+    return [play_game(strategy, seed) for seed in seeds]
+
+
+def run_tournament(strategies: Sequence[str], seeds: Sequence[int],
+                   workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Play each strategy on every seeded layout and summarise the results"""
+    if not seeds:
+        raise ValueError("At least one seed is required")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    for strategy in strategies:
+        if strategy not in COMPUTER_STRATEGIES:
+            raise ValueError(f"Unknown computer strategy: {strategy}")
+
+    # One batch per strategy per worker keeps inter-process overhead low
+    batch_count = workers or os.cpu_count() or 1
+    batches = [list(seeds[i::batch_count]) for i in range(batch_count)]
+    batches = [batch for batch in batches if batch]
+
+    results: Dict[str, Dict] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            strategy: [executor.submit(_play_batch, strategy, batch) for batch in batches]
+            for strategy in strategies
+        }
+        for strategy, strategy_futures in futures.items():
+            shots: List[int] = []
+            latencies: List[float] = []
+            for future in strategy_futures:
+                for game_shots, game_latencies in future.result():
+                    shots.append(game_shots)
+                    latencies.extend(game_latencies)
+            results[strategy] = summarize(shots, latencies)
+
+    return results
+
+
+def summarize(shots: Sequence[int], latencies: Sequence[float]) -> Dict:
+    """Mean and percentile shots-to-win, plus per-move latency in microseconds"""
+    return {
+        "games": len(shots),
+        "mean_shots": mean(shots),
+        "shots": {p: percentile(shots, p) for p in PERCENTILES},
+        "mean_latency_us": mean(latencies) * 1e6,
+        "latency_us": {p: percentile(latencies, p) * 1e6 for p in PERCENTILES},
+    }
+
+
+def format_report(results: Dict[str, Dict]) -> str:
+    header = ["strategy", "games", "mean shots"]
+    header += [f"p{p} shots" for p in PERCENTILES]
+    header += ["mean us/move"]
+    header += [f"p{p} us/move" for p in PERCENTILES]
+
+    rows = [header]
+    for strategy, stats in sorted(results.items(), key=lambda item: item[1]["mean_shots"]):
+        row = [strategy, str(stats["games"]), f"{stats['mean_shots']:.1f}"]
+        row += [str(stats["shots"][p]) for p in PERCENTILES]
+        row += [f"{stats['mean_latency_us']:.1f}"]
+        row += [f"{stats['latency_us'][p]:.1f}" for p in PERCENTILES]
+        rows.append(row)
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark computer strategies against seeded boards")
+    parser.add_argument("--strategies", nargs="+", default=sorted(COMPUTER_STRATEGIES),
+                        choices=sorted(COMPUTER_STRATEGIES), help="Strategies to play (default: all registered)")
+    parser.add_argument("--games", type=int, default=200, help="Number of seeded layouts")
+    parser.add_argument("--seed", type=int, default=0, help="First layout seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    seeds = list(range(args.seed, args.seed + args.games))
+    results = run_tournament(args.strategies, seeds, workers=args.workers)
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()